@@ -52,17 +52,19 @@ public:
     auto const b = n_bins();
     sampling_positions = Utils::get_cylindrical_sampling_positions(
         lim[0], lim[1], lim[2], b[0], b[1], b[2], sampling_density);
+    // We have to rotate the coordinates since the utils function assumes
+    // z-axis symmetry. The rotation is the same for all sampling positions.
+    auto const z_axis = Utils::Vector3d{{0.0, 0.0, 1.0}};
+    auto const theta = Utils::angle_between(z_axis, transform_params->axis());
+    auto const rot_axis =
+        Utils::vector_product(z_axis, transform_params->axis()).normalize();
+    auto const rotate = theta > std::numeric_limits<double>::epsilon();
+    auto const center = transform_params->center();
     for (auto &p : sampling_positions) {
       auto p_cart = Utils::transform_coordinate_cylinder_to_cartesian(p);
-      // We have to rotate the coordinates since the utils function assumes
-      // z-axis symmetry.
-      auto const z_axis = Utils::Vector3d{{0.0, 0.0, 1.0}};
-      auto const theta = Utils::angle_between(z_axis, transform_params->axis());
-      auto const rot_axis =
-          Utils::vector_product(z_axis, transform_params->axis()).normalize();
-      if (theta > std::numeric_limits<double>::epsilon())
+      if (rotate)
         p_cart = Utils::vec_rotate(rot_axis, theta, p_cart);
-      p = p_cart + transform_params->center();
+      p = p_cart + center;
     }
   }
   std::vector<Utils::Vector3d> sampling_positions;
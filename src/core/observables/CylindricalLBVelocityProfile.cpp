@@ -35,18 +35,23 @@ std::vector<double> CylindricalLBVelocityProfile::operator()(
 
   decltype(sampling_positions) local_positions{};
   std::vector<vel_type> local_velocities{};
+  local_positions.reserve(sampling_positions.size());
+  local_velocities.reserve(sampling_positions.size());
 
   auto const &lb = System::get_system().lb;
   auto const vel_conv = lb.get_lattice_speed();
 
+  auto const center = transform_params->center();
+  auto const axis = transform_params->axis();
+  auto const orientation = transform_params->orientation();
+
   for (auto const &pos : sampling_positions) {
     if (auto const vel = lb.get_interpolated_velocity(pos)) {
-      auto const pos_shifted = pos - transform_params->center();
+      auto const pos_shifted = pos - center;
       auto const pos_cyl = Utils::transform_coordinate_cartesian_to_cylinder(
-          pos_shifted, transform_params->axis(),
-          transform_params->orientation());
+          pos_shifted, axis, orientation);
       auto const vel_cyl = Utils::transform_vector_cartesian_to_cylinder(
-          (*vel) * vel_conv, transform_params->axis(), pos_shifted);
+          (*vel) * vel_conv, axis, pos_shifted);
 
       local_positions.emplace_back(pos_cyl);
       local_velocities.emplace_back(vel_cyl);
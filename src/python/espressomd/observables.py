@@ -35,7 +35,7 @@ class Observable(ScriptInterfaceHelper):
     _so_creation_policy = "GLOBAL"
 
     def calculate(self):
-        return np.array(self.call_method("calculate")).reshape(self.shape())
+        return np.asarray(self.call_method("calculate")).reshape(self.shape())
 
 
 class ProfileObservable(Observable):
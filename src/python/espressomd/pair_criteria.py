@@ -14,6 +14,7 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import numpy as np
 from .script_interface import ScriptInterfaceHelper, script_interface_register
 from .particle_data import ParticleHandle
 
@@ -28,19 +29,32 @@ class _PairCriterion(ScriptInterfaceHelper):
         p1, p2 : :obj:`espressomd.particle_data.ParticleHandle` or :obj:`int` containing the particle id.
             Particle pair.
         """
-        id1 = None
-        id2 = None
-        if isinstance(p1, ParticleHandle) and isinstance(p2, ParticleHandle):
-            id1 = p1.id
-            id2 = p2.id
-        elif isinstance(p1, int) and isinstance(p2, int):
-            id1 = p1
-            id2 = p2
-        else:
+        id1 = p1.id if isinstance(p1, ParticleHandle) else p1
+        id2 = p2.id if isinstance(p2, ParticleHandle) else p2
+        if not (isinstance(id1, int) and isinstance(id2, int)):
             raise ValueError(
                 "arguments must be instances of int or ParticleHandle")
         return self.call_method("decide", id1=id1, id2=id2)
 
+    def decide_many(self, ids1, ids2):
+        """Makes a decision for each of the particle pairs specified.
+
+        Parameters
+        ----------
+        ids1, ids2 : (N,) array_like of :obj:`int`
+            Particle ids of the pairs.
+
+        Returns
+        -------
+        (N,) array_like of :obj:`bool`
+            Decision for each pair.
+        """
+        decisions = self.call_method(
+            "decide_many",
+            ids1=np.asarray(ids1, dtype=int).reshape(-1),
+            ids2=np.asarray(ids2, dtype=int).reshape(-1))
+        return np.asarray(decisions, dtype=bool)
+
 
 @script_interface_register
 class DistanceCriterion(_PairCriterion):
@@ -27,9 +27,11 @@
 
 #include "core/pair_criteria/PairCriterion.hpp"
 
+#include <cstddef>
 #include <memory>
 #include <stdexcept>
 #include <string>
+#include <vector>
 
 namespace ScriptInterface {
 namespace PairCriteria {
@@ -44,6 +46,20 @@ public:
       return pair_criterion()->decide(get_value<int>(parameters.at("id1")),
                                       get_value<int>(parameters.at("id2")));
     }
+    if (method == "decide_many") {
+      auto const ids1 = get_value<std::vector<int>>(parameters, "ids1");
+      auto const ids2 = get_value<std::vector<int>>(parameters, "ids2");
+      if (ids1.size() != ids2.size()) {
+        throw std::invalid_argument(
+            "Parameters 'ids1' and 'ids2' must have the same length");
+      }
+      auto const criterion = pair_criterion();
+      std::vector<int> decisions(ids1.size());
+      for (std::size_t i = 0u; i < ids1.size(); ++i) {
+        decisions[i] = criterion->decide(ids1[i], ids2[i]);
+      }
+      return decisions;
+    }
     throw std::runtime_error("Unknown method called.");
   }
 };
@@ -56,6 +56,14 @@ class TestCylindricalObservable(ut.TestCase):
     v_phi = 0.7
     v_z = 0.8
 
+    # rotation from the original box frame to the frame of the observables:
+    # align original z to observable z (original x now points along
+    # [sqrt(3),-sqrt(3),-sqrt(3)]), then align original x to observable
+    # orientation
+    rot_to_observable_frame = \
+        tests_common.rotation_matrix([1, 1, 0], -3. / 4. * np.pi) @ \
+        tests_common.rotation_matrix([1, -1, 0], -np.pi / 2.)
+
     def tearDown(self):
         self.system.part.clear()
 
@@ -70,36 +78,21 @@ class TestCylindricalObservable(ut.TestCase):
         zs = np.linspace(z_min, z_max, num=n_part)
         angles = np.linspace(-0.99 * np.pi, 0.999 * np.pi, num=n_part)
 
-        positions = []
-        velocities = []
-
-        for angle, z in zip(angles, zs):
-            position = np.array(
-                [semi_x * np.cos(angle),
-                 semi_y * np.sin(angle),
-                 z])
+        positions = np.stack([semi_x * np.cos(angles),
+                              semi_y * np.sin(angles),
+                              zs], axis=-1)
 
-            e_r, e_phi, e_z = tests_common.get_cylindrical_basis_vectors(
-                position)
-            velocity = self.v_r * e_r + self.v_phi * e_phi + self.v_z * e_z
+        e_r, e_phi, e_z = tests_common.get_cylindrical_basis_vectors(positions)
+        velocities = self.v_r * e_r + self.v_phi * e_phi + self.v_z * e_z
 
-            positions.append(position)
-            velocities.append(velocity)
+        return positions, velocities
 
-        return np.array(positions), np.array(velocities)
-
-    def align_with_observable_frame(self, vec):
+    def align_with_observable_frame(self, vecs):
         """
         Rotate vectors from the original box frame to the frame of the observables.
         """
 
-        # align original z to observable z
-        vec = tests_common.rodrigues_rot(vec, [1, -1, 0], -np.pi / 2.)
-        # original x now points along [sqrt(3),-sqrt(3),-sqrt(3)]
-
-        # align original x to observable orientation
-        vec = tests_common.rodrigues_rot(vec, [1, 1, 0], -3. / 4. * np.pi)
-        return vec
+        return np.asarray(vecs) @ self.rot_to_observable_frame.T
 
     def setup_system_get_np_hist(self):
         """
@@ -109,6 +102,8 @@ class TestCylindricalObservable(ut.TestCase):
         to the frame of the observables.
         After calculating the core observables, the result should be
         the same as the np histogram obtained from the original box frame.
+        The observable parameters are returned as a copy of the class
+        parameters with the ids of the new particles.
         """
 
         positions, velocities = self.calc_ellipsis_pos_vel(100, 0.99 *
@@ -118,28 +113,22 @@ class TestCylindricalObservable(ut.TestCase):
                                                            self.params['max_r'])
 
         # first, get the numpy histogram of the cylinder coordinates
-        pos_cyl = []
-        for pos in positions:
-            pos_cyl.append(
-                tests_common.transform_pos_from_cartesian_to_polar_coordinates(pos))
+        pos_cyl = tests_common.transform_pos_from_cartesian_to_polar_coordinates(
+            positions)
         np_hist, np_edges = tests_common.get_histogram(
-            np.array(pos_cyl), self.params, 'cylindrical')
+            pos_cyl, self.params, 'cylindrical')
         np_dens = tests_common.normalize_cylindrical_hist(
-            np_hist.copy(), self.params)
+            np_hist, self.params)
 
         # now align the positions and velocities with the frame of reference
         # used in the observables
-        pos_aligned = []
-        vel_aligned = []
-        for pos, vel in zip(positions, velocities):
-            pos_aligned.append(
-                self.align_with_observable_frame(pos) +
-                self.cyl_transform_params.center)
-            vel_aligned.append(self.align_with_observable_frame(vel))
-        self.system.part.add(pos=pos_aligned, v=vel_aligned)
-        self.params['ids'] = self.system.part.all().id
+        pos_aligned = self.align_with_observable_frame(positions) + \
+            self.cyl_transform_params.center
+        vel_aligned = self.align_with_observable_frame(velocities)
+        partcls = self.system.part.add(pos=pos_aligned, v=vel_aligned)
+        obs_params = {**self.params, 'ids': partcls.id}
 
-        return np_dens, np_edges
+        return np_dens, np_edges, obs_params
 
     def check_edges(self, observable, np_edges):
         core_edges = observable.call_method("edges")
@@ -151,10 +140,10 @@ class TestCylindricalObservable(ut.TestCase):
         Check that the result from the observable (in its own frame)
         matches the np result from the box frame
         """
-        np_dens, np_edges = self.setup_system_get_np_hist()
+        np_dens, np_edges, obs_params = self.setup_system_get_np_hist()
 
         cyl_dens_prof = espressomd.observables.CylindricalDensityProfile(
-            **self.params)
+            **obs_params)
         core_hist = cyl_dens_prof.calculate()
         np.testing.assert_array_almost_equal(np_dens, core_hist)
         self.check_edges(cyl_dens_prof, np_edges)
@@ -164,21 +153,14 @@ class TestCylindricalObservable(ut.TestCase):
         Check that the result from the observable (in its own frame)
         matches the np result from the box frame
         """
-        np_dens, np_edges = self.setup_system_get_np_hist()
+        np_dens, np_edges, obs_params = self.setup_system_get_np_hist()
         cyl_vel_prof = espressomd.observables.CylindricalVelocityProfile(
-            **self.params)
+            **obs_params)
         core_hist = cyl_vel_prof.calculate()
-        core_hist_v_r = core_hist[:, :, :, 0]
-        core_hist_v_phi = core_hist[:, :, :, 1]
-        core_hist_v_z = core_hist[:, :, :, 2]
-        np_hist_binary = np_dens
-        np_hist_binary[np.nonzero(np_hist_binary)] = 1
-        np.testing.assert_array_almost_equal(
-            np_hist_binary * self.v_r, core_hist_v_r)
-        np.testing.assert_array_almost_equal(
-            np_hist_binary * self.v_phi, core_hist_v_phi)
-        np.testing.assert_array_almost_equal(
-            np_hist_binary * self.v_z, core_hist_v_z)
+        np_hist_binary = np.where(np_dens > 0., 1., 0.)
+        np_hist_v = np_hist_binary[..., np.newaxis] * \
+            [self.v_r, self.v_phi, self.v_z]
+        np.testing.assert_allclose(core_hist, np_hist_v, rtol=0., atol=1e-6)
         self.check_edges(cyl_vel_prof, np_edges)
 
     def test_flux_density_profile(self):
@@ -186,17 +168,13 @@ class TestCylindricalObservable(ut.TestCase):
         Check that the result from the observable (in its own frame)
         matches the np result from the box frame
         """
-        np_dens, np_edges = self.setup_system_get_np_hist()
+        np_dens, np_edges, obs_params = self.setup_system_get_np_hist()
         cyl_flux_dens = espressomd.observables.CylindricalFluxDensityProfile(
-            **self.params)
+            **obs_params)
         core_hist = cyl_flux_dens.calculate()
-        core_hist_v_r = core_hist[:, :, :, 0]
-        core_hist_v_phi = core_hist[:, :, :, 1]
-        core_hist_v_z = core_hist[:, :, :, 2]
-        np.testing.assert_array_almost_equal(np_dens * self.v_r, core_hist_v_r)
-        np.testing.assert_array_almost_equal(
-            np_dens * self.v_phi, core_hist_v_phi)
-        np.testing.assert_array_almost_equal(np_dens * self.v_z, core_hist_v_z)
+        np_hist_fl = np_dens[..., np.newaxis] * \
+            [self.v_r, self.v_phi, self.v_z]
+        np.testing.assert_allclose(core_hist, np_hist_fl, rtol=0., atol=1e-6)
         self.check_edges(cyl_flux_dens, np_edges)
 
     def test_cylindrical_pid_profile_interface(self):
@@ -63,6 +63,13 @@ class CylindricalLBObservableCommon:
     v_phi = 0.04
     v_z = 0.03
 
+    # rotation from the original box frame to the frame of the observables:
+    # align original z to observable z (original x now points along
+    # [0,0,-1]), then align original x to observable orientation
+    rot_to_observable_frame = \
+        tests_common.rotation_matrix([1, 0, 0], np.pi) @ \
+        tests_common.rotation_matrix([0, 1, 0], np.pi / 2.)
+
     def setUp(self):
         self.lbf = self.lb_class(**self.lb_params, **self.lb_params_extra)
         self.system.lb = self.lbf
@@ -78,26 +85,16 @@ class CylindricalLBObservableCommon:
         The cartesian velocities are calculated here.
         """
 
-        vels = []
-        for pos in positions:
-            e_r, e_phi, e_z = tests_common.get_cylindrical_basis_vectors(pos)
-            velocity = self.v_r * e_r + self.v_phi * e_phi + self.v_z * e_z
-            vels.append(velocity)
-        return vels
+        e_r, e_phi, e_z = tests_common.get_cylindrical_basis_vectors(positions)
+        return self.v_r * e_r + self.v_phi * e_phi + self.v_z * e_z
 
-    def align_with_observable_frame(self, vec):
+    def align_with_observable_frame(self, vecs):
         """
         Rotate vectors from the original box frame to
         the frame of the observables.
         """
 
-        # align original z to observable z
-        vec = tests_common.rodrigues_rot(vec, [0, 1, 0], np.pi / 2.)
-        # original x now points along [0,0,-1]
-
-        # align original x to observable orientation
-        vec = tests_common.rodrigues_rot(vec, [1, 0, 0], np.pi)
-        return vec
+        return np.asarray(vecs) @ self.rot_to_observable_frame.T
 
     def setup_system_get_np_hist(self):
         """
@@ -106,6 +103,8 @@ class CylindricalLBObservableCommon:
         and velocities to the frame of the observables.
         After calculating the core observables, the result should be
         the same as the np histogram obtained from the original box frame.
+        The observable parameters are returned as a copy of the class
+        parameters with the ids of the new particles.
         """
 
         nodes = np.array(np.meshgrid([1, 2], [1, 2], [
@@ -114,39 +113,35 @@ class CylindricalLBObservableCommon:
         velocities = self.calc_vel_at_pos(positions)
 
         # get the histogram from numpy
-        pos_cyl = []
-        for pos in positions:
-            pos_cyl.append(
-                tests_common.transform_pos_from_cartesian_to_polar_coordinates(pos))
+        pos_cyl = tests_common.transform_pos_from_cartesian_to_polar_coordinates(
+            positions)
         np_hist, np_edges = tests_common.get_histogram(
-            np.array(pos_cyl), self.params, 'cylindrical')
+            pos_cyl, self.params, 'cylindrical')
 
         # the particles only determine the evaluation points, not the values of
         # the observables
-        np_hist[np.nonzero(np_hist)] = 1
+        np_hist = np.where(np_hist > 0., 1., 0.)
 
         # now align the positions and velocities with the frame of reference
         # used in the observables
-        pos_aligned = []
-        vel_aligned = []
-        for pos, vel in zip(positions, velocities):
-            pos_aligned.append(
-                self.align_with_observable_frame(pos) +
-                self.cyl_transform_params.center)
-            vel_aligned.append(self.align_with_observable_frame(vel))
-        node_aligned = np.array(
-            np.rint(
-                np.array(pos_aligned) -
-                3 *
-                [0.5]),
-            dtype=int)
-        self.system.part.add(pos=pos_aligned, v=vel_aligned)
-        self.params['ids'] = self.system.part.all().id
-
-        for node, vel in zip(node_aligned, vel_aligned):
-            self.lbf[node].velocity = vel
-
-        return np_hist, np_edges
+        pos_aligned = self.align_with_observable_frame(positions) + \
+            self.cyl_transform_params.center
+        vel_aligned = self.align_with_observable_frame(velocities)
+        node_aligned = np.rint(pos_aligned - 0.5).astype(int)
+        partcls = self.system.part.add(pos=pos_aligned, v=vel_aligned)
+        obs_params = {**self.params, 'ids': partcls.id}
+
+        # set the fluid velocity of all sampled nodes in a single slice
+        # assignment; the other nodes of the bounding box keep the zero
+        # velocity of the freshly initialized fluid
+        lower = np.min(node_aligned, axis=0)
+        upper = np.max(node_aligned, axis=0) + 1
+        node_vel = np.zeros((*(upper - lower), 3))
+        node_vel[tuple((node_aligned - lower).T)] = vel_aligned
+        self.lbf[lower[0]:upper[0], lower[1]:upper[1],
+                 lower[2]:upper[2]].velocity = node_vel
+
+        return np_hist, np_edges, obs_params
 
     def check_edges(self, observable, np_edges):
         core_edges = observable.call_method("edges")
@@ -159,19 +154,14 @@ class CylindricalLBObservableCommon:
         matches the np result from the box frame
         """
 
-        np_hist_binary, np_edges = self.setup_system_get_np_hist()
+        np_hist_binary, np_edges, obs_params = self.setup_system_get_np_hist()
         vel_obs = espressomd.observables.CylindricalLBVelocityProfileAtParticlePositions(
-            **self.params)
+            **obs_params)
         core_hist_v = vel_obs.calculate()
-        core_hist_v_r = core_hist_v[:, :, :, 0]
-        core_hist_v_phi = core_hist_v[:, :, :, 1]
-        core_hist_v_z = core_hist_v[:, :, :, 2]
-        np.testing.assert_array_almost_equal(
-            np_hist_binary * self.v_r, core_hist_v_r)
-        np.testing.assert_array_almost_equal(
-            np_hist_binary * self.v_phi, core_hist_v_phi)
-        np.testing.assert_array_almost_equal(
-            np_hist_binary * self.v_z, core_hist_v_z)
+        np_hist_v = np_hist_binary[..., np.newaxis] * \
+            [self.v_r, self.v_phi, self.v_z]
+        np.testing.assert_allclose(core_hist_v, np_hist_v,
+                                   rtol=0., atol=1e-6)
         self.check_edges(vel_obs, np_edges)
 
     def test_cylindrical_lb_profile_interface(self):
@@ -249,30 +239,15 @@ class CylindricalLBObservableCommon:
         matches the np result from the box frame.
         Only for CPU because density interpolation is not implemented for GPU LB.
         """
-        np_hist_binary, np_edges = self.setup_system_get_np_hist()
+        np_hist_binary, np_edges, obs_params = self.setup_system_get_np_hist()
 
         flux_obs = espressomd.observables.CylindricalLBFluxDensityProfileAtParticlePositions(
-            **self.params)
+            **obs_params)
         core_hist_fl = flux_obs.calculate()
-        core_hist_fl_r = core_hist_fl[:, :, :, 0]
-        core_hist_fl_phi = core_hist_fl[:, :, :, 1]
-        core_hist_fl_z = core_hist_fl[:, :, :, 2]
-
-        np.testing.assert_array_almost_equal(
-            np_hist_binary *
-            self.lb_params['density'] *
-            self.v_r,
-            core_hist_fl_r)
-        np.testing.assert_array_almost_equal(
-            np_hist_binary *
-            self.lb_params['density'] *
-            self.v_phi,
-            core_hist_fl_phi)
-        np.testing.assert_array_almost_equal(
-            np_hist_binary *
-            self.lb_params['density'] *
-            self.v_z,
-            core_hist_fl_z)
+        np_hist_fl = np_hist_binary[..., np.newaxis] * \
+            self.lb_params['density'] * [self.v_r, self.v_phi, self.v_z]
+        np.testing.assert_allclose(core_hist_fl, np_hist_fl,
+                                   rtol=0., atol=1e-6)
         self.check_edges(flux_obs, np_edges)
 
 
@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
+import numpy as np
 import unittest as ut
 import unittest_decorators as utx
 import espressomd
@@ -48,6 +49,7 @@ class PairCriteria(ut.TestCase):
         self.system.periodicity = (True, True, True)
         self.assertTrue(dc.decide(self.p1, self.p2))
         self.assertTrue(dc.decide(self.p1.id, self.p2.id))
+        self.assertTrue(dc.decide(self.p1, self.p2.id))
 
     def test_distance_crit_non_periodic(self):
         dc = espressomd.pair_criteria.DistanceCriterion(cut_off=0.1)
@@ -61,6 +63,22 @@ class PairCriteria(ut.TestCase):
         dc = espressomd.pair_criteria.DistanceCriterion(cut_off=0.1)
         with self.assertRaises(RuntimeError):
             dc.call_method("unknown")
+        with self.assertRaisesRegex(ValueError, "arguments must be instances of int or ParticleHandle"):
+            dc.decide(self.p1, 1.)
+        with self.assertRaisesRegex(ValueError, "Parameters 'ids1' and 'ids2' must have the same length"):
+            dc.decide_many([self.p1.id], [self.p1.id, self.p2.id])
+
+    def test_decide_many(self):
+        dc = espressomd.pair_criteria.DistanceCriterion(cut_off=0.1)
+        ids1 = [self.p1.id, self.p1.id, self.p2.id]
+        ids2 = [self.p2.id, self.p1.id, self.p1.id]
+        for periodicity in [(True, True, True), (False, False, False)]:
+            self.system.periodicity = periodicity
+            ref = [dc.decide(id1, id2) for id1, id2 in zip(ids1, ids2)]
+            decisions = dc.decide_many(ids1, ids2)
+            self.assertEqual(decisions.dtype, bool)
+            np.testing.assert_array_equal(decisions, ref)
+        self.assertEqual(len(dc.decide_many([], [])), 0)
 
     @utx.skipIfMissingFeatures("LENNARD_JONES")
     def test_energy_crit(self):
@@ -158,24 +158,33 @@ def transform_pos_from_cartesian_to_polar_coordinates(pos):
 
     Parameters
     ----------
-    pos : array_like :obj:`float`
-        ``x``, ``y``, and ``z``-component of the cartesian position.
+    pos : (3,) or (N, 3) array_like of :obj:`float`
+        ``x``, ``y``, and ``z``-component of the cartesian position(s).
 
     Returns
     -------
-    array_like
-        The given position in polar coordinates.
+    (3,) or (N, 3) array_like of :obj:`float`
+        The given position(s) in polar coordinates.
 
     """
-    return np.array([np.sqrt(pos[0]**2.0 + pos[1]**2.0),
-                     np.arctan2(pos[1], pos[0]), pos[2]])
+    pos = np.asarray(pos)
+    return np.stack([np.hypot(pos[..., 0], pos[..., 1]),
+                     np.arctan2(pos[..., 1], pos[..., 0]),
+                     pos[..., 2]], axis=-1)
 
 
 def get_cylindrical_basis_vectors(pos):
-    phi = transform_pos_from_cartesian_to_polar_coordinates(pos)[1]
-    e_r = np.array([np.cos(phi), np.sin(phi), 0.])
-    e_phi = np.array([-np.sin(phi), np.cos(phi), 0.])
-    e_z = np.array([0., 0., 1.])
+    pos = np.asarray(pos)
+    r = np.hypot(pos[..., 0], pos[..., 1])
+    # cos(phi) = x / r and sin(phi) = y / r; on the axis, phi = 0
+    on_axis = r == 0.
+    r = np.where(on_axis, 1., r)
+    cos_phi = np.where(on_axis, 1., pos[..., 0] / r)
+    sin_phi = pos[..., 1] / r
+    zeros = np.zeros_like(r)
+    e_r = np.stack([cos_phi, sin_phi, zeros], axis=-1)
+    e_phi = np.stack([-sin_phi, cos_phi, zeros], axis=-1)
+    e_z = np.stack([zeros, zeros, np.ones_like(r)], axis=-1)
     return e_r, e_phi, e_z
 
 
@@ -193,6 +202,17 @@ def rodrigues_rot(vec, axis, angle):
         (1 - np.cos(angle)) * np.dot(axis, vec) * axis
 
 
+def rotation_matrix(axis, angle):
+    """
+    Return the matrix form of :func:`rodrigues_rot`.
+    """
+    axis = np.asarray(axis, dtype=float) / np.linalg.norm(axis)
+    K = np.array([[0., -axis[2], axis[1]],
+                  [axis[2], 0., -axis[0]],
+                  [-axis[1], axis[0], 0.]])
+    return np.identity(3) + np.sin(angle) * K + (1. - np.cos(angle)) * K @ K
+
+
 def rotation_matrix_quat(p):
     """
     Return the rotation matrix associated with quaternion.
@@ -222,6 +242,30 @@ def rotation_matrix_quat(p):
     return A
 
 
+def get_cylindrical_bin_volume(cyl_obs_params):
+    """
+    Get the bin volumes of a histogram in cylindrical coordinates.
+
+    Parameters
+    ----------
+    cyl_obs_params : :obj:`dict`
+        A dictionary containing the common parameters of the cylindrical histogram observables.
+        Needs to contain the information about number and range of bins.
+
+    Returns
+    -------
+    (N,) array_like of :obj:`float`
+        The volume of the bins for each of the ``N`` radial bins.
+    """
+
+    r_edges, phi_edges, z_edges = get_histogram_bin_edges(
+        cyl_obs_params, 'cylindrical')
+    phi_bin_size = phi_edges[1] - phi_edges[0]
+    z_bin_size = z_edges[1] - z_edges[0]
+    return np.pi * np.diff(r_edges**2.0) * \
+        phi_bin_size / (2.0 * np.pi) * z_bin_size
+
+
 def normalize_cylindrical_hist(histogram, cyl_obs_params):
     """
     normalize a histogram in cylindrical coordinates. Helper to test the output
@@ -236,27 +280,35 @@ def normalize_cylindrical_hist(histogram, cyl_obs_params):
         Needs to contain the information about number and range of bins.
     """
 
-    n_r_bins = cyl_obs_params['n_r_bins']
-    n_phi_bins = cyl_obs_params['n_phi_bins']
-    n_z_bins = cyl_obs_params['n_z_bins']
-    min_r = cyl_obs_params['min_r']
-    max_r = cyl_obs_params['max_r']
-    min_phi = cyl_obs_params['min_phi']
-    max_phi = cyl_obs_params['max_phi']
-    min_z = cyl_obs_params['min_z']
-    max_z = cyl_obs_params['max_z']
-
-    bin_volume = np.zeros(n_r_bins)
-    r_bin_size = (max_r - min_r) / n_r_bins
-    phi_bin_size = (max_phi - min_phi) / n_phi_bins
-    z_bin_size = (max_z - min_z) / n_z_bins
-    for i in range(n_r_bins):
-        bin_volume = np.pi * ((min_r + r_bin_size * (i + 1))**2.0 -
-                              (min_r + r_bin_size * i)**2.0) * \
-            phi_bin_size / (2.0 * np.pi) * z_bin_size
-        histogram[i, :, :] /= bin_volume
-
-    return histogram
+    inv_bin_volume = 1. / get_cylindrical_bin_volume(cyl_obs_params)
+    return histogram * inv_bin_volume[:, np.newaxis, np.newaxis]
+
+
+def get_histogram_bin_edges(obs_params, coord_system):
+    """
+    Get the bin edges of a histogram observable.
+
+    Parameters
+    ----------
+    obs_params : :obj:`dict`
+        Parameters of the observable.
+    coord_system : :obj:`str`, {'cartesian', 'cylindrical'}
+        Coordinate system.
+
+    Returns
+    -------
+    :obj:`list` of array_like
+        Bin edges along each dimension.
+
+    """
+    assert coord_system in ('cartesian', 'cylindrical'), \
+        f"Unknown coord system '{coord_system}'"
+    if coord_system == 'cartesian':
+        dims = ('x', 'y', 'z')
+    elif coord_system == 'cylindrical':
+        dims = ('r', 'phi', 'z')
+    return [np.linspace(obs_params[f'min_{dim}'], obs_params[f'max_{dim}'],
+                        obs_params[f'n_{dim}_bins'] + 1) for dim in dims]
 
 
 def get_histogram(pos, obs_params, coord_system, **kwargs):
@@ -280,23 +332,8 @@ def get_histogram(pos, obs_params, coord_system, **kwargs):
         Bins and bin edges.
 
     """
-    assert coord_system in ('cartesian', 'cylindrical'), \
-        f"Unknown coord system '{coord_system}'"
-    if coord_system == 'cartesian':
-        bins = (obs_params['n_x_bins'],
-                obs_params['n_y_bins'],
-                obs_params['n_z_bins'])
-        extent = [(obs_params['min_x'], obs_params['max_x']),
-                  (obs_params['min_y'], obs_params['max_y']),
-                  (obs_params['min_z'], obs_params['max_z'])]
-    elif coord_system == 'cylindrical':
-        bins = (obs_params['n_r_bins'],
-                obs_params['n_phi_bins'],
-                obs_params['n_z_bins'])
-        extent = [(obs_params['min_r'], obs_params['max_r']),
-                  (obs_params['min_phi'], obs_params['max_phi']),
-                  (obs_params['min_z'], obs_params['max_z'])]
-    return np.histogramdd(pos, bins=bins, range=extent, **kwargs)
+    edges = get_histogram_bin_edges(obs_params, coord_system)
+    return np.histogramdd(pos, bins=edges, **kwargs)
 
 
 # Generic Lennard-Jones